@@ -4,13 +4,17 @@ import tempfile
 import sys
 import webbrowser
 import re
+import gzip
+import json
+import time
+import hashlib
 import sqlite3
-from threading import Timer
+from threading import Timer, Lock, Thread, Event
 from datetime import datetime
 
 # Try importing required packages with error handling
 try:
-    from flask import Flask, render_template, request, redirect, url_for, flash, session, send_file
+    from flask import Flask, render_template, request, redirect, url_for, flash, session, send_file, Response, stream_with_context, jsonify
     from werkzeug.utils import secure_filename
     import google.generativeai as genai
     from dotenv import load_dotenv
@@ -25,6 +29,12 @@ except ImportError as e:
     print("pip install flask werkzeug PyPDF2 google-generativeai python-dotenv pandas scikit-learn")
     sys.exit(1)
 
+# Brotli is optional; responses fall back to gzip when it is not installed
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -49,17 +59,60 @@ app.config['UPLOAD_FOLDER'] = 'uploads'
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max upload size
 ALLOWED_EXTENSIONS = {'pdf'}
 
+# Drop the whitespace left behind by template tags; it adds up on large tables
+app.jinja_env.trim_blocks = True
+app.jinja_env.lstrip_blocks = True
+
+# Response optimization settings
+COMPRESSIBLE_MIMETYPES = {'text/html', 'application/json'}
+COMPRESS_MIN_SIZE = 500  # bytes; smaller bodies are not worth compressing
+COMPRESS_LEVEL = 6
+STATIC_MAX_AGE = 365 * 24 * 60 * 60  # fingerprinted assets never change under the same URL
+SERVER_INSTANCE_ID = os.urandom(4).hex()  # invalidates page ETags when the app restarts
+
 # Create uploads folder if it doesn't exist
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 
 # Database setup
-DATABASE = 'resume_analyzer.db'
+DATABASE = os.environ.get('RESUME_ANALYZER_DB', 'resume_analyzer.db')
+
+# Change feed settings for the live admin dashboard
+FEED_POLL_INTERVAL = 2  # seconds between checks of the change log
+FEED_HEARTBEAT_INTERVAL = 15  # seconds between keep-alive comments on idle streams
+FEED_MAX_STREAM_SECONDS = 5 * 60  # streams close after this; the reconnect re-checks the login
+FEED_RETENTION = 7 * 24 * 60 * 60  # seconds of change history kept for reconnecting dashboards
+
+# Background re-analysis of applications saved while the LLM was unavailable
+REANALYSIS_BATCH_SIZE = 10  # pending rows retried per pass
+REANALYSIS_BASE_DELAY = 30  # seconds between passes while the LLM is healthy
+REANALYSIS_MAX_DELAY = 30 * 60  # backoff cap while the LLM keeps failing
+REANALYSIS_MAX_ATTEMPTS = 8  # after this many row-specific failures a row is left for manual review
+REANALYSIS_OUTAGE_ERRORS = 2  # consecutive errors with no success that mark the LLM as down
+PLACEHOLDER_ANALYSIS = "API Error - Manual review required"
+
+# Columns the dashboard table needs; skips the large analysis and resume text
+DASHBOARD_COLUMNS = 'id, name, email, domain, key_skills, missing_skills, score, bias_score, final_score, date, analysis_status'
 
 def get_db_connection():
     conn = sqlite3.connect(DATABASE)
     conn.row_factory = sqlite3.Row
     return conn
 
+def add_column_if_missing(cursor, table, column, definition):
+    """Add a column to an existing table; returns True if it had to be added"""
+    columns = [row[1] for row in cursor.execute(f'PRAGMA table_info({table})')]
+    if column in columns:
+        return False
+    cursor.execute(f'ALTER TABLE {table} ADD COLUMN {column} {definition}')
+    return True
+
+def prune_change_log(cursor):
+    """Drop change log entries past the retention window, always keeping the newest"""
+    cursor.execute(
+        'DELETE FROM application_changes WHERE (created_at IS NULL OR created_at < ?) AND seq < (SELECT MAX(seq) FROM application_changes)',
+        (int(time.time()) - FEED_RETENTION,)
+    )
+
 def init_db():
     conn = get_db_connection()
     cursor = conn.cursor()
@@ -83,6 +136,67 @@ def init_db():
     )
     ''')
     
+    # Columns added after the original schema, so older databases get them too.
+    # resume_text and the applicant fields let failed analyses be retried later.
+    add_column_if_missing(cursor, 'applications', 'resume_text', 'TEXT')
+    add_column_if_missing(cursor, 'applications', 'gender', 'TEXT')
+    add_column_if_missing(cursor, 'applications', 'age', 'TEXT')
+    add_column_if_missing(cursor, 'applications', 'education', 'TEXT')
+    add_column_if_missing(cursor, 'applications', 'retry_count', 'INTEGER DEFAULT 0')
+    add_column_if_missing(cursor, 'applications', 'last_attempted_at', 'REAL')
+    if add_column_if_missing(cursor, 'applications', 'analysis_status', "TEXT DEFAULT 'complete'"):
+        # Placeholders saved before the queue existed; their text is re-read from the PDF
+        cursor.execute("UPDATE applications SET analysis_status = 'pending' WHERE analysis = ?",
+                       (PLACEHOLDER_ANALYSIS,))
+    
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_applications_analysis_status ON applications (analysis_status, id)')
+    
+    # Create change log used by the live admin dashboard feed.
+    # Every insert, delete and visible update on applications appends a row
+    # here, so open dashboards only need to ask for changes past their last seq.
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS application_changes (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        application_id INTEGER NOT NULL,
+        action TEXT NOT NULL,
+        created_at INTEGER
+    )
+    ''')
+    add_column_if_missing(cursor, 'application_changes', 'created_at', 'INTEGER')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_application_changes_created_at ON application_changes (created_at)')
+    
+    # Triggers are recreated so databases made by older versions pick up changes to them
+    for trigger in ('applications_after_insert', 'applications_after_update', 'applications_after_delete'):
+        cursor.execute(f'DROP TRIGGER IF EXISTS {trigger}')
+    
+    cursor.execute('''
+    CREATE TRIGGER applications_after_insert AFTER INSERT ON applications
+    BEGIN
+        INSERT INTO application_changes (application_id, action, created_at) VALUES (NEW.id, 'upsert', CAST(strftime('%s', 'now') AS INTEGER));
+    END
+    ''')
+    
+    # Only fire when something the dashboard shows actually changed, so
+    # bookkeeping such as re-analysis retry counts doesn't reach the feed
+    dashboard_columns = [column.strip() for column in DASHBOARD_COLUMNS.split(',')]
+    changed = ' OR '.join(f'OLD.{column} IS NOT NEW.{column}' for column in dashboard_columns)
+    cursor.execute(f'''
+    CREATE TRIGGER applications_after_update AFTER UPDATE OF {', '.join(dashboard_columns)} ON applications
+    WHEN {changed}
+    BEGIN
+        INSERT INTO application_changes (application_id, action, created_at) VALUES (NEW.id, 'upsert', CAST(strftime('%s', 'now') AS INTEGER));
+    END
+    ''')
+    
+    cursor.execute('''
+    CREATE TRIGGER applications_after_delete AFTER DELETE ON applications
+    BEGIN
+        INSERT INTO application_changes (application_id, action, created_at) VALUES (OLD.id, 'delete', CAST(strftime('%s', 'now') AS INTEGER));
+    END
+    ''')
+    
+    prune_change_log(cursor)
+    
     # Create admin credentials table
     cursor.execute('''
     CREATE TABLE IF NOT EXISTS admin_credentials (
@@ -265,7 +379,7 @@ def generate_summary(pdf_text):
 
 def get_all_applications():
     conn = get_db_connection()
-    applications = conn.execute('SELECT * FROM applications ORDER BY score DESC, id DESC').fetchall()
+    applications = conn.execute(f'SELECT {DASHBOARD_COLUMNS} FROM applications ORDER BY score DESC, id DESC').fetchall()
     
     # Convert to list of dictionaries
     result = []
@@ -292,7 +406,17 @@ def get_application_by_id(application_id):
     conn.close()
     return None
 
-def save_application(name, email, domain, key_skills, missing_skills, score, analysis, overview, resume_path, bias_score=None):
+def calculate_final_score(score, bias_score):
+    # Invert the bias score (10 - bias_score) so that higher bias means lower score
+    # Then calculate weighted average: 70% resume score, 30% fairness score
+    fairness_score = 10 - bias_score  # Convert bias score to fairness score
+    final_score = (0.7 * score) + (0.3 * fairness_score)  # Weight resume score more heavily
+    
+    # Ensure final score stays within 0-10 range
+    return max(0, min(10, final_score))
+
+def save_application(name, email, domain, key_skills, missing_skills, score, analysis, overview, resume_path, bias_score=None,
+                     resume_text=None, gender=None, age=None, education=None, analysis_status='complete'):
     conn = get_db_connection()
     
     # Convert lists to comma-separated strings
@@ -302,18 +426,11 @@ def save_application(name, email, domain, key_skills, missing_skills, score, ana
     # Calculate final score using inverted bias score
     if bias_score is None:
         bias_score = 5.0  # Default neutral score
-    
-    # Invert the bias score (10 - bias_score) so that higher bias means lower score
-    # Then calculate weighted average: 70% resume score, 30% fairness score
-    fairness_score = 10 - bias_score  # Convert bias score to fairness score
-    final_score = (0.7 * score) + (0.3 * fairness_score)  # Weight resume score more heavily
-    
-    # Ensure final score stays within 0-10 range
-    final_score = max(0, min(10, final_score))
+    final_score = calculate_final_score(score, bias_score)
     
     conn.execute(
-        'INSERT INTO applications (name, email, domain, key_skills, missing_skills, score, bias_score, final_score, date, analysis, overview, resume_path) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
-        (name, email, domain, key_skills_str, missing_skills_str, score, bias_score, final_score, datetime.now().strftime('%b %d, %Y'), analysis, overview, resume_path)
+        'INSERT INTO applications (name, email, domain, key_skills, missing_skills, score, bias_score, final_score, date, analysis, overview, resume_path, resume_text, gender, age, education, analysis_status) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+        (name, email, domain, key_skills_str, missing_skills_str, score, bias_score, final_score, datetime.now().strftime('%b %d, %Y'), analysis, overview, resume_path, resume_text, gender, age, education, analysis_status)
     )
     
     conn.commit()
@@ -322,6 +439,20 @@ def save_application(name, email, domain, key_skills, missing_skills, score, ana
     
     return app_id
 
+def update_application_analysis(application_id, analysis, extracted_data, bias_score):
+    """Replace a placeholder record with a completed analysis"""
+    conn = get_db_connection()
+    
+    conn.execute(
+        "UPDATE applications SET domain = ?, key_skills = ?, missing_skills = ?, score = ?, bias_score = ?, final_score = ?, analysis = ?, overview = ?, analysis_status = 'complete' WHERE id = ?",
+        (extracted_data['domain'].upper(), ','.join(extracted_data['key_skills']), ','.join(extracted_data['missing_skills']),
+         extracted_data['score'], bias_score, calculate_final_score(extracted_data['score'], bias_score),
+         analysis, extracted_data['overview'], application_id)
+    )
+    
+    conn.commit()
+    conn.close()
+
 def delete_application(application_id):
     conn = get_db_connection()
     
@@ -344,6 +475,123 @@ def delete_application(application_id):
     
     conn.close()
 
+def get_latest_change_seq():
+    conn = get_db_connection()
+    seq = conn.execute('SELECT COALESCE(MAX(seq), 0) FROM application_changes').fetchone()[0]
+    conn.close()
+    return seq
+
+def change_log_covers(since_seq):
+    """Whether the change log still holds every entry after since_seq"""
+    conn = get_db_connection()
+    oldest_seq = conn.execute('SELECT MIN(seq) FROM application_changes').fetchone()[0]
+    conn.close()
+    return oldest_seq is None or since_seq >= oldest_seq - 1
+
+def get_changes_since(since_seq, upto_seq):
+    """Collapse the change log between two seqs into upserted rows and deleted ids"""
+    conn = get_db_connection()
+    changes = conn.execute(
+        'SELECT application_id, action FROM application_changes WHERE seq > ? AND seq <= ? ORDER BY seq',
+        (since_seq, upto_seq)
+    ).fetchall()
+    
+    # Only the latest action per application matters
+    latest_actions = {}
+    for change in changes:
+        latest_actions[change['application_id']] = change['action']
+    
+    upsert_ids = [app_id for app_id, action in latest_actions.items() if action == 'upsert']
+    upserted = []
+    if upsert_ids:
+        placeholders = ','.join('?' * len(upsert_ids))
+        rows = conn.execute(f'SELECT {DASHBOARD_COLUMNS} FROM applications WHERE id IN ({placeholders})', upsert_ids).fetchall()
+        for row in rows:
+            app_dict = dict(row)
+            app_dict['key_skills'] = app_dict['key_skills'].split(',')
+            app_dict['missing_skills'] = app_dict['missing_skills'].split(',')
+            upserted.append(app_dict)
+    
+    # Rows that were upserted and then removed before this read count as deleted
+    found_ids = {app_dict['id'] for app_dict in upserted}
+    deleted = [app_id for app_id, action in latest_actions.items()
+               if action == 'delete' or app_id not in found_ids]
+    
+    conn.close()
+    return upserted, deleted
+
+class ChangeFeed:
+    """Shared view of the application change log for all open dashboards.
+
+    The latest seq is checked at most once per poll interval no matter how many
+    dashboards are streaming, and the most recent batch of changes is cached so
+    clients sitting on the same cursor reuse one rendered payload.
+    """
+    
+    def __init__(self, poll_interval):
+        self.poll_interval = poll_interval
+        self._lock = Lock()
+        self._checked_at = 0.0
+        self._latest_seq = 0
+        self._batch_key = None
+        self._batch = None
+    
+    def latest_seq(self):
+        with self._lock:
+            now = time.monotonic()
+            if now - self._checked_at >= self.poll_interval:
+                self._latest_seq = get_latest_change_seq()
+                self._checked_at = now
+            return self._latest_seq
+    
+    def batch(self, since_seq, upto_seq):
+        with self._lock:
+            if self._batch_key == (since_seq, upto_seq):
+                return self._batch
+        
+        if not change_log_covers(since_seq):
+            # Entries this client missed were pruned; it has to reload the page
+            batch = {'seq': upto_seq, 'reload': True, 'upserted': [], 'deleted': []}
+            with self._lock:
+                self._batch_key = (since_seq, upto_seq)
+                self._batch = batch
+            return batch
+        
+        upserted, deleted = get_changes_since(since_seq, upto_seq)
+        batch = {
+            'seq': upto_seq,
+            'reload': False,
+            'upserted': [
+                {
+                    'id': app_dict['id'],
+                    'html': render_template('_application_row.html', app=app_dict)
+                }
+                for app_dict in upserted
+            ],
+            'deleted': deleted
+        }
+        
+        with self._lock:
+            self._batch_key = (since_seq, upto_seq)
+            self._batch = batch
+        return batch
+
+change_feed = ChangeFeed(FEED_POLL_INTERVAL)
+
+def build_applicant_data(gender, age, education, domain):
+    """Feature row for calculate_bias_score; new applicants have no tenure history"""
+    return {
+        'Gender': gender,
+        'Age': age,
+        'Education': education,
+        'Department': domain,
+        'JobRole': domain,
+        'YearsAtCompany': 0,
+        'YearsInCurrentRole': 0,
+        'YearsSinceLastPromotion': 0,
+        'YearsWithCurrManager': 0
+    }
+
 def calculate_bias_score(applicant_data):
     """Calculate bias score for a new applicant using the pre-trained model"""
     try:
@@ -401,6 +649,244 @@ def calculate_bias_score(applicant_data):
         print(f"Error calculating bias score: {str(e)}")
         return 5.0 
 
+def get_reanalysis_counts():
+    conn = get_db_connection()
+    rows = conn.execute(
+        "SELECT analysis_status, COUNT(*) FROM applications WHERE analysis_status IN ('pending', 'failed') GROUP BY analysis_status"
+    ).fetchall()
+    conn.close()
+    
+    counts = {'pending': 0, 'failed': 0}
+    for status, count in rows:
+        counts[status] = count
+    return counts
+
+class ReanalysisQueue:
+    """Background worker that retries analyses saved as manual-review placeholders.
+
+    Pending rows are retried a batch at a time, least recently attempted first
+    so a few rows that always fail can't stall the rest. A pass whose first few calls
+    all fail is treated as an outage: it ends early, doubles the wait before the
+    next pass and charges no row an attempt. A healthy pass resets the wait, and
+    a full batch is followed straight away by the next so the backlog from a
+    past outage clears in bulk. Only failures the LLM can't be blamed for -
+    unreadable resumes, or errors on a pass where other rows succeeded - count
+    toward max_attempts.
+    """
+    
+    def __init__(self, batch_size, base_delay, max_delay, max_attempts, outage_errors):
+        self.batch_size = batch_size
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_attempts = max_attempts
+        self.outage_errors = outage_errors
+        self.delay = base_delay
+        self.next_attempt_at = None
+        self._wake_event = Event()
+        self._start_lock = Lock()
+        self._thread = None
+    
+    def start(self):
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = Thread(target=self._run, name='reanalysis-queue', daemon=True)
+                self._thread.start()
+    
+    def wake(self):
+        """Start the next pass now instead of waiting out the current delay"""
+        self._wake_event.set()
+    
+    def retry_failed(self):
+        """Give rows that ran out of attempts another full set and retry immediately"""
+        conn = get_db_connection()
+        conn.execute("UPDATE applications SET analysis_status = 'pending', retry_count = 0 WHERE analysis_status = 'failed'")
+        conn.commit()
+        conn.close()
+        
+        self.delay = self.base_delay
+        self.wake()
+    
+    def _run(self):
+        while True:
+            self._wake_event.clear()
+            try:
+                completed, healthy = self.process_batch()
+            except Exception as e:
+                app.logger.error(f"Error in re-analysis queue: {str(e)}")
+                completed, healthy = 0, False
+            
+            # The server may run for weeks, so the change log is trimmed here too
+            try:
+                conn = get_db_connection()
+                prune_change_log(conn.cursor())
+                conn.commit()
+                conn.close()
+            except Exception as e:
+                app.logger.error(f"Error pruning change log: {str(e)}")
+            
+            if healthy:
+                self.delay = self.base_delay
+                if completed == self.batch_size:
+                    # Likely more backlog waiting; keep draining
+                    continue
+            else:
+                self.delay = min(self.delay * 2, self.max_delay)
+            
+            self.next_attempt_at = time.time() + self.delay
+            self._wake_event.wait(self.delay)
+    
+    def process_batch(self):
+        """Retry one batch of pending analyses; returns (rows completed, whether the LLM answered)"""
+        conn = get_db_connection()
+        rows = conn.execute(
+            # Least recently attempted first, so rows that keep failing can't hog the front
+            "SELECT id, resume_path, resume_text, gender, age, education FROM applications WHERE analysis_status = 'pending' ORDER BY last_attempted_at, id LIMIT ?",
+            (self.batch_size,)
+        ).fetchall()
+        conn.close()
+        
+        completed = 0
+        errored_ids = []
+        for row in rows:
+            self._record_attempt(row['id'])
+            resume_text = row['resume_text']
+            if not resume_text and os.path.exists(row['resume_path']):
+                # Saved before resume text was stored; read it back from the upload
+                with open(row['resume_path'], 'rb') as f:
+                    resume_text = extract_text_from_pdf(f)
+            if not resume_text:
+                # Nothing to analyze, which says nothing about the LLM's health
+                self._record_failure(row['id'])
+                continue
+            
+            try:
+                analysis_result = generate_summary(resume_text)
+                if not analysis_result:
+                    raise ValueError("Empty analysis returned")
+            except Exception as e:
+                app.logger.error(f"Re-analysis of application {row['id']} failed: {str(e)}")
+                errored_ids.append(row['id'])
+                if not completed and len(errored_ids) >= self.outage_errors:
+                    # The LLM looks down; that says nothing about these rows
+                    return 0, False
+                continue
+            
+            extracted_data = extract_data_from_analysis(analysis_result)
+            applicant_data = build_applicant_data(row['gender'] or 'Unknown', row['age'] or 30,
+                                                  row['education'] or 'Bachelor', extracted_data['domain'])
+            bias_score = calculate_bias_score(applicant_data)
+            update_application_analysis(row['id'], analysis_result, extracted_data, bias_score)
+            completed += 1
+        
+        if not completed:
+            # Too few rows to tell an outage from bad input; wait and try again
+            return 0, not errored_ids
+        
+        # The LLM answered other rows this pass, so these errors are down to the rows
+        for application_id in errored_ids:
+            self._record_failure(application_id)
+        return completed, True
+    
+    def _record_attempt(self, application_id):
+        # Not a dashboard column, so this stays out of the change feed
+        conn = get_db_connection()
+        conn.execute('UPDATE applications SET last_attempted_at = ? WHERE id = ?', (time.time(), application_id))
+        conn.commit()
+        conn.close()
+    
+    def _record_failure(self, application_id):
+        conn = get_db_connection()
+        conn.execute(
+            "UPDATE applications SET retry_count = retry_count + 1, analysis_status = CASE WHEN retry_count + 1 >= ? THEN 'failed' ELSE 'pending' END WHERE id = ?",
+            (self.max_attempts, application_id)
+        )
+        conn.commit()
+        conn.close()
+
+reanalysis_queue = ReanalysisQueue(REANALYSIS_BATCH_SIZE, REANALYSIS_BASE_DELAY, REANALYSIS_MAX_DELAY,
+                                   REANALYSIS_MAX_ATTEMPTS, REANALYSIS_OUTAGE_ERRORS)
+
+@app.before_request
+def start_reanalysis_queue():
+    # Started from the first request rather than at import so it runs in the
+    # process that serves requests under the debug reloader, flask run or WSGI
+    reanalysis_queue.start()
+
+_asset_fingerprints = {}
+
+def asset_url(filename):
+    """Static URL with a content hash so assets can be cached for a year"""
+    file_path = os.path.join(app.static_folder, filename)
+    mtime = os.path.getmtime(file_path)
+    cached = _asset_fingerprints.get(filename)
+    if cached is None or cached[0] != mtime:
+        with open(file_path, 'rb') as f:
+            cached = (mtime, hashlib.md5(f.read()).hexdigest()[:12])
+        _asset_fingerprints[filename] = cached
+    return url_for('static', filename=filename, v=cached[1])
+
+@app.context_processor
+def inject_asset_url():
+    return {'asset_url': asset_url}
+
+def compress_body(data, accept_encodings):
+    """Compress data with the best encoding the client accepts, or return (None, data)"""
+    if brotli is not None and accept_encodings['br']:
+        return 'br', brotli.compress(data, quality=5)
+    if accept_encodings['gzip']:
+        return 'gzip', gzip.compress(data, compresslevel=COMPRESS_LEVEL)
+    return None, data
+
+@app.after_request
+def optimize_response(response):
+    # Fingerprinted static assets can be cached forever
+    if request.endpoint == 'static':
+        if 'v' in request.args:
+            response.cache_control.no_cache = None
+            response.cache_control.public = True
+            response.cache_control.max_age = STATIC_MAX_AGE
+            response.cache_control.immutable = True
+        return response
+    
+    # Streams (the dashboard feed) and file downloads are sent as-is
+    if (response.is_streamed or response.direct_passthrough
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES):
+        return response
+    
+    # Conditional GET: pages are per-admin, so browsers revalidate with the ETag
+    if request.method == 'GET' and response.status_code == 200:
+        response.cache_control.private = True
+        response.cache_control.no_cache = True
+        # Weak because the same ETag is served for every content encoding.
+        # Views that know their own version (the dashboard) set it themselves.
+        response.add_etag(weak=True)
+        response.make_conditional(request)
+    
+    response.vary.add('Accept-Encoding')
+    if (response.status_code != 200 or 'Content-Encoding' in response.headers
+            or len(response.get_data()) < COMPRESS_MIN_SIZE):
+        return response
+    
+    encoding, data = compress_body(response.get_data(), request.accept_encodings)
+    if encoding:
+        response.set_data(data)
+        response.headers['Content-Encoding'] = encoding
+    return response
+
+def get_score_stats(applications):
+    """Count applications per final score band, plus those pending or failed re-analysis"""
+    stats = {'total': len(applications), 'high': 0, 'medium': 0, 'low': 0, 'pending': 0, 'failed': 0}
+    for application in applications:
+        if application['analysis_status'] in ('pending', 'failed'):
+            stats[application['analysis_status']] += 1
+        if application['final_score'] >= 7:
+            stats['high'] += 1
+        elif application['final_score'] >= 4:
+            stats['medium'] += 1
+        else:
+            stats['low'] += 1
+    return stats
+
 @app.route('/', methods=['GET', 'POST'])
 def index():
     # Import the job_scrap function
@@ -446,6 +932,11 @@ def index():
                     flash('Could not extract text from the resume. The file might be encrypted, damaged, or contain only images.')
                     return redirect(request.url)
                 
+                # Kept with the application so a failed analysis can be retried later
+                gender = request.form.get('gender', 'Unknown')
+                age = request.form.get('age', 30)
+                education = request.form.get('education', 'Bachelor')
+                
                 try:
                     # Try to generate resume analysis
                     analysis_result = generate_summary(pdf_text)
@@ -455,17 +946,7 @@ def index():
                         extracted_data = extract_data_from_analysis(analysis_result)
                         
                         # Calculate bias score
-                        applicant_data = {
-                            'Gender': request.form.get('gender', 'Unknown'),
-                            'Age': request.form.get('age', 30),
-                            'Education': request.form.get('education', 'Bachelor'),
-                            'Department': extracted_data['domain'],
-                            'JobRole': extracted_data['domain'],
-                            'YearsAtCompany': 0,
-                            'YearsInCurrentRole': 0,
-                            'YearsSinceLastPromotion': 0,
-                            'YearsWithCurrManager': 0
-                        }
+                        applicant_data = build_applicant_data(gender, age, education, extracted_data['domain'])
                         bias_score = calculate_bias_score(applicant_data)
                         
                         # Save application to database with bias score
@@ -479,7 +960,11 @@ def index():
                             analysis_result,
                             extracted_data['overview'],
                             file_path,
-                            bias_score
+                            bias_score,
+                            resume_text=pdf_text,
+                            gender=gender,
+                            age=age,
+                            education=education
                         )
                         
                         # Store application ID in session for result page
@@ -505,9 +990,14 @@ def index():
                         mock_data['key_skills'],
                         mock_data['missing_skills'],
                         mock_data['score'],
-                        "API Error - Manual review required",
+                        PLACEHOLDER_ANALYSIS,
                         mock_data['overview'],
-                        file_path
+                        file_path,
+                        resume_text=pdf_text,
+                        gender=gender,
+                        age=age,
+                        education=education,
+                        analysis_status='pending'
                     )
                     
                     # Store application ID in session
@@ -531,11 +1021,85 @@ def index():
 def admin():
     # Check if user is logged in
     if session.get('admin_logged_in'):
+        # Read the feed position first so nothing committed in between is missed
+        feed_seq = get_latest_change_seq()
+        
+        # The table only changes when the change log moves, so a refresh with
+        # nothing new can be answered before querying or rendering anything
+        # (pages carrying a flash message are one-offs and keep a body-hash ETag)
+        etag = f'dashboard-{SERVER_INSTANCE_ID}-{feed_seq}'
+        has_flashes = '_flashes' in session
+        if not has_flashes and request.if_none_match.contains_weak(etag):
+            response = Response(status=304)
+            response.set_etag(etag, weak=True)
+            return response
+        
         applications = get_all_applications()
-        return render_template('admin_dashboard.html', applications=applications)
+        response = app.make_response(render_template('admin_dashboard.html', applications=applications,
+                                                     stats=get_score_stats(applications), feed_seq=feed_seq))
+        if not has_flashes:
+            response.set_etag(etag, weak=True)
+        return response
     else:
         return render_template('admin_login.html')
 
+@app.route('/admin/feed')
+def admin_feed():
+    # An EventSource stops reconnecting on 204, so logged-out tabs go quiet
+    if not session.get('admin_logged_in'):
+        return '', 204
+    
+    # Browsers resend the last event id on reconnect, which takes precedence
+    since = request.headers.get('Last-Event-ID') or request.args.get('since') or 0
+    try:
+        since = int(since)
+    except ValueError:
+        since = 0
+    
+    def stream(cursor):
+        opened_at = last_sent = time.monotonic()
+        # End the stream now and then so a logged-out tab stops receiving rows;
+        # the EventSource reconnects with its current cookie and Last-Event-ID
+        while time.monotonic() - opened_at < FEED_MAX_STREAM_SECONDS:
+            latest = change_feed.latest_seq()
+            if latest > cursor:
+                batch = change_feed.batch(cursor, latest)
+                yield f"id: {latest}\nevent: changes\ndata: {json.dumps(batch)}\n\n"
+                cursor = latest
+                last_sent = time.monotonic()
+            elif latest < cursor:
+                # The database was reset underneath us; follow it
+                cursor = latest
+            elif time.monotonic() - last_sent >= FEED_HEARTBEAT_INTERVAL:
+                yield ": keep-alive\n\n"
+                last_sent = time.monotonic()
+            time.sleep(FEED_POLL_INTERVAL)
+    
+    response = Response(stream_with_context(stream(since)), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+@app.route('/admin/reanalysis', methods=['GET'])
+def reanalysis_status():
+    if not session.get('admin_logged_in'):
+        return jsonify({'error': 'Not logged in'}), 401
+    
+    status = get_reanalysis_counts()
+    if reanalysis_queue.next_attempt_at is not None:
+        status['next_attempt_in'] = max(0, round(reanalysis_queue.next_attempt_at - time.time()))
+    return jsonify(status)
+
+@app.route('/admin/reanalysis/retry', methods=['POST'])
+def retry_reanalysis():
+    if not session.get('admin_logged_in'):
+        return redirect(url_for('admin'))
+    
+    reanalysis_queue.retry_failed()
+    flash('Re-analysis of failed applications has been started')
+    
+    return redirect(url_for('admin'))
+
 @app.route('/admin/application/<int:application_id>')
 def application_detail(application_id):
     # Check if user is logged in
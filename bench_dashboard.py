@@ -0,0 +1,66 @@
+"""Measure admin dashboard page size and render time with a large applications table.
+
+Usage: python bench_dashboard.py [num_rows]
+Seeds a throwaway database, so the real resume_analyzer.db is left untouched.
+"""
+import os
+import sys
+import tempfile
+import time
+import statistics
+from datetime import datetime
+
+# Point the app at a throwaway database before importing it, since the
+# import itself runs init_db()
+_bench_dir = tempfile.TemporaryDirectory()
+os.environ['RESUME_ANALYZER_DB'] = os.path.join(_bench_dir.name, 'bench.db')
+
+import app as resume_app
+
+NUM_ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+RUNS = 5
+
+def seed_database(num_rows):
+    conn = resume_app.get_db_connection()
+    date = datetime.now().strftime('%b %d, %Y')
+    conn.executemany(
+        'INSERT INTO applications (name, email, domain, key_skills, missing_skills, score, bias_score, final_score, date, analysis, overview, resume_path) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+        [
+            (f'Applicant {i}', f'applicant{i}@example.com', 'DATA SCIENCE',
+             'Python,MySQL,Machine Learning,Tableau', 'Cloud,Deep Learning,Big Data',
+             i % 10 + 1, 5.0, (0.7 * (i % 10 + 1)) + 1.5, date, 'Analysis', 'Overview',
+             f'uploads/resume_{i}.pdf')
+            for i in range(num_rows)
+        ]
+    )
+    conn.commit()
+    conn.close()
+
+def measure(client, headers):
+    timings = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        response = client.get('/admin', headers=headers)
+        timings.append(time.perf_counter() - start)
+    return response, statistics.median(timings)
+
+def main():
+    with _bench_dir:
+        seed_database(NUM_ROWS)
+
+        client = resume_app.app.test_client()
+        with client.session_transaction() as sess:
+            sess['admin_logged_in'] = True
+
+        print(f"Admin dashboard with {NUM_ROWS} applications (median of {RUNS} runs)")
+        for label, headers in [('identity', {}), ('gzip', {'Accept-Encoding': 'gzip'}), ('br', {'Accept-Encoding': 'br'})]:
+            response, elapsed = measure(client, headers)
+            encoding = response.headers.get('Content-Encoding', 'identity')
+            print(f"  {label:<8} {len(response.data):>10,} bytes ({encoding})  {elapsed * 1000:8.1f} ms")
+
+        etag = client.get('/admin').headers['ETag']
+        response, elapsed = measure(client, {'If-None-Match': etag})
+        print(f"  refresh  {len(response.data):>10,} bytes ({response.status_code})  {elapsed * 1000:8.1f} ms")
+
+if __name__ == '__main__':
+    main()
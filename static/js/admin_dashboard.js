@@ -0,0 +1,140 @@
+// Toggle sidebar
+document.getElementById('menu-toggle').addEventListener('click', function() {
+    document.getElementById('sidebar').classList.toggle('collapsed');
+    document.getElementById('main-content').classList.toggle('expanded');
+});
+
+// Search functionality
+let activeSearchTerm = '';
+
+function rowMatchesSearch(row, searchTerm) {
+    const cells = row.getElementsByTagName('td');
+    for (let j = 0; j < cells.length; j++) {
+        if (cells[j].textContent.toLowerCase().includes(searchTerm)) {
+            return true;
+        }
+    }
+    return false;
+}
+
+function applySearch(row) {
+    row.style.display = rowMatchesSearch(row, activeSearchTerm) ? '' : 'none';
+}
+
+document.getElementById('searchButton').addEventListener('click', function() {
+    activeSearchTerm = document.getElementById('searchInput').value.toLowerCase();
+    document.querySelectorAll('#applicationsBody tr[data-app-id]').forEach(applySearch);
+});
+
+// Live updates: patch rows and stats from the change feed instead of reloading
+const applicationsBody = document.getElementById('applicationsBody');
+
+function rowSortsBefore(row, score, id) {
+    // Mirrors the server ordering: score DESC, id DESC
+    const rowScore = parseFloat(row.dataset.score);
+    const rowId = parseInt(row.dataset.appId, 10);
+    return score > rowScore || (score === rowScore && id > rowId);
+}
+
+function upsertRow(item) {
+    const template = document.createElement('template');
+    template.innerHTML = item.html.trim();
+    const newRow = template.content.querySelector('tr');
+    const existing = applicationsBody.querySelector('tr[data-app-id="' + item.id + '"]');
+    if (existing) {
+        existing.remove();
+    }
+
+    const score = parseFloat(newRow.dataset.score);
+    const rows = applicationsBody.querySelectorAll('tr[data-app-id]');
+    let before = null;
+    for (let i = 0; i < rows.length; i++) {
+        if (rowSortsBefore(rows[i], score, item.id)) {
+            before = rows[i];
+            break;
+        }
+    }
+    // Keep the table filtered by whatever search is currently applied
+    applySearch(newRow);
+    applicationsBody.insertBefore(newRow, before);
+}
+
+function deleteRow(id) {
+    const row = applicationsBody.querySelector('tr[data-app-id="' + id + '"]');
+    if (row) {
+        row.remove();
+    }
+}
+
+function updateStats() {
+    const rows = applicationsBody.querySelectorAll('tr[data-app-id]');
+    let high = 0, medium = 0, low = 0, pending = 0, failed = 0;
+    rows.forEach(function(row) {
+        if (row.dataset.analysisStatus === 'pending') {
+            pending++;
+        } else if (row.dataset.analysisStatus === 'failed') {
+            failed++;
+        }
+        const finalScore = parseFloat(row.dataset.finalScore);
+        if (finalScore >= 7) {
+            high++;
+        } else if (finalScore >= 4) {
+            medium++;
+        } else {
+            low++;
+        }
+    });
+    document.getElementById('statTotal').textContent = rows.length;
+    document.getElementById('statHigh').textContent = high;
+    document.getElementById('statMedium').textContent = medium;
+    document.getElementById('statLow').textContent = low;
+    document.getElementById('statPending').textContent = pending;
+    document.getElementById('pendingIndicator').style.display = pending ? '' : 'none';
+    document.getElementById('statFailed').textContent = failed;
+    document.getElementById('retryFailedForm').style.display = failed ? '' : 'none';
+    document.getElementById('applicationsWrapper').style.display = rows.length ? '' : 'none';
+    document.getElementById('emptyState').style.display = rows.length ? 'none' : '';
+}
+
+if (window.EventSource) {
+    const feed = new EventSource('/admin/feed?since=' + applicationsBody.dataset.feedSeq);
+    feed.addEventListener('changes', function(event) {
+        const batch = JSON.parse(event.data);
+        if (batch.reload) {
+            window.location.reload();
+            return;
+        }
+        batch.deleted.forEach(deleteRow);
+        batch.upserted.forEach(upsertRow);
+        updateStats();
+    });
+}
+
+// Export to CSV
+function exportToCSV() {
+    const table = document.getElementById('applicationsTable');
+    const rows = table.getElementsByTagName('tr');
+    let csv = [];
+
+    for (let i = 0; i < rows.length; i++) {
+        const row = [], cols = rows[i].querySelectorAll('td, th');
+
+        for (let j = 0; j < cols.length - 1; j++) { // Skip the actions column
+            let data = cols[j].innerText.replace(/(\r\n|\n|\r)/gm, '').replace(/(\s\s)/gm, ' ');
+            data = data.replace(/"/g, '""');
+            row.push('"' + data + '"');
+        }
+        csv.push(row.join(','));
+    }
+
+    const csvString = csv.join('\n');
+    const filename = 'resume_applications_' + new Date().toISOString().slice(0, 10) + '.csv';
+    const link = document.createElement('a');
+    link.style.display = 'none';
+    link.setAttribute('target', '_blank');
+    link.setAttribute('href', 'data:text/csv;charset=utf-8,' + encodeURIComponent(csvString));
+    link.setAttribute('download', filename);
+    document.body.appendChild(link);
+    link.click();
+    document.body.removeChild(link);
+}
@@ -0,0 +1,6 @@
+// Point the shared delete modal at whichever application's button opened it
+document.getElementById('deleteModal').addEventListener('show.bs.modal', function(event) {
+    const button = event.relatedTarget;
+    document.getElementById('deleteForm').setAttribute('action', button.dataset.deleteUrl);
+    document.getElementById('deleteApplicantName').textContent = button.dataset.applicantName;
+});